@@ -1,14 +1,50 @@
 import os
 import math
-import requests
+import time
+import asyncio
+import hashlib
+import inspect
+import functools
+import contextvars
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import List, Optional
+from contextlib import asynccontextmanager
+
+import httpx
+import orjson
+from async_lru import alru_cache
+import redis.asyncio as redis
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
+from pydantic import BaseModel
 
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="Weather API", version="1.4")
+REDIS_URL = os.getenv("REDIS_URL")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled client for the whole app so upstream connections are reused;
+    # HTTP/2 lets concurrent fan-out (e.g. /compare) share a single connection
+    app.state.http = httpx.AsyncClient(
+        base_url=OPENWEATHER_BASE_URL,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        http2=True,
+        timeout=10.0,
+    )
+    # Response cache is optional; without REDIS_URL every request goes upstream
+    app.state.redis = redis.Redis.from_url(REDIS_URL) if REDIS_URL else None
+    yield
+    await app.state.http.aclose()
+    if app.state.redis is not None:
+        await app.state.redis.aclose()
+
+
+app = FastAPI(title="Weather API", version="1.4", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -20,28 +56,189 @@ app.add_middleware(
 
 API_KEY = os.getenv("WEATHER_API_KEY")
 
+# OpenWeather endpoints, relative to the shared client's base URL
+OPENWEATHER_BASE_URL = "https://api.openweathermap.org"
+GEOCODE_URL = "/geo/1.0/direct"
+REVERSE_GEOCODE_URL = "/geo/1.0/reverse"
+WEATHER_URL = "/data/2.5/weather"
+FORECAST_URL = "/data/2.5/forecast"
+ONECALL_URL = "/data/2.5/onecall"
+AIR_POLLUTION_URL = "/data/2.5/air_pollution"
+
+UNITS = frozenset(("metric", "imperial"))
+
+# UV index upper bounds (exclusive) for each category
+UV_BOUNDS = (3, 6, 8, 11)
+UV_CATEGORIES = ("Low", "Moderate", "High", "Very High", "Extreme")
+
+# Outfit tier upper bounds (inclusive), i.e. 0 / 10 / 20 °C in each unit system
+OUTFIT_TEMP_BOUNDS = {"metric": (0, 10, 20), "imperial": (32, 50, 68)}
+
+# (clothing, accessories, notes) per temperature tier, coldest first
+OUTFIT_TIERS = (
+    (("Heavy winter coat",), ("Gloves, scarf, warm hat",), ("Very cold weather.",)),
+    (("Coat or thick jacket",), (), ("Cool temperatures.",)),
+    (("Light jacket or sweater",), (), ()),
+    (("Light clothing",), (), ("Warm temperatures.",)),
+)
+
+AQI_CATEGORIES = {
+    1: "Good",
+    2: "Fair",
+    3: "Moderate",
+    4: "Poor",
+    5: "Very Poor",
+}
+
+# Caps how many cities /compare fetches at once (OpenWeather rate limits)
+COMPARE_LIMIT = asyncio.Semaphore(8)
+
+# ============================================================
+# Response Cache (Redis)
+# ============================================================
+
+# Seconds a cached response counts as fresh
+CACHE_TTLS = {"short": 10, "normal": 60, "long": 3600}
+
+# How long a stale response is kept around as a fallback for upstream errors
+STALE_GRACE = 24 * 3600
+
+# Clock for freshness checks; tests swap this out
+_now = time.time
+
+
+# Per-request flag set when a handler had to fall back to placeholder data
+_cache_state = contextvars.ContextVar("cache_state", default=None)
+
+
+def mark_degraded():
+    """Flag the current response as a fallback so it is not cached."""
+    state = _cache_state.get()
+    if state is not None:
+        state["degraded"] = True
+
+
+def upstream_failed(e):
+    if isinstance(e, HTTPException):
+        return e.status_code >= 500
+    return isinstance(e, httpx.HTTPError)
+
+
+def cache_key(name, arguments):
+    # Normalize the way the handlers will: units falls back to metric and
+    # city names are case-insensitive; everything else is taken verbatim
+    values = []
+    for arg, v in arguments.items():
+        if arg == "units":
+            v = validate_units(v)
+        elif arg in ("city", "cities"):
+            v = v.strip().lower()
+        values.append(str(v))
+    parts = ":".join(values)
+    return "weather:" + hashlib.sha1(f"{name}:{parts}".encode()).hexdigest()
+
+
+def cached(policy="normal"):
+    """Cache a handler's result in Redis, serving the stale copy on upstream failure."""
+    ttl = CACHE_TTLS[policy]
+
+    def decorator(func):
+        sig = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            store = app.state.redis
+            if store is None:
+                return await func(*args, **kwargs)
+
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = cache_key(func.__name__, bound.arguments)
+
+            try:
+                entry = await store.hgetall(key)
+            except redis.RedisError:
+                entry = {}
+
+            if entry and float(entry[b"stale_at"]) > _now():
+                return orjson.loads(entry[b"body"])
+
+            # Shared (not copied) with tasks spawned by the handler, so
+            # mark_degraded() inside asyncio.gather still reaches us
+            state = {"degraded": False}
+            token = _cache_state.set(state)
+            try:
+                result = await func(*args, **kwargs)
+            except (HTTPException, httpx.HTTPError) as e:
+                # Upstream trouble: fall back to the last good response if we have one
+                if entry and upstream_failed(e):
+                    return orjson.loads(entry[b"body"])
+                raise
+            finally:
+                _cache_state.reset(token)
+
+            if state["degraded"]:
+                # Never overwrite a good entry with placeholder data
+                if entry:
+                    return orjson.loads(entry[b"body"])
+                mark_degraded()
+                return result
+
+            try:
+                async with store.pipeline(transaction=True) as pipe:
+                    pipe.hset(
+                        key,
+                        mapping={"body": orjson.dumps(result), "stale_at": _now() + ttl},
+                    )
+                    pipe.expire(key, ttl + STALE_GRACE)
+                    await pipe.execute()
+            except redis.RedisError:
+                pass
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 # ============================================================
 # Utility Helpers
 # ============================================================
 
 def validate_units(units: str):
-    return units if units in ("metric", "imperial") else "metric"
+    return units if units in UNITS else "metric"
+
 
+def upstream_json(r):
+    """Decode an OpenWeather response, raising 502 if the service itself failed."""
+    if r.status_code >= 500:
+        raise HTTPException(502, "Weather service unavailable")
+    try:
+        return orjson.loads(r.content)
+    except orjson.JSONDecodeError:
+        raise HTTPException(502, "Weather service unavailable")
 
-def geocode_city(city):
+
+async def geocode_city(city):
     """Return (lat, lon, name, country) or 404."""
-    url = "http://api.openweathermap.org/geo/1.0/direct"
+    return await _geocode(city.strip().lower())
+
+
+# Coordinates never change: in-process LRU in front of the Redis cache
+@alru_cache(maxsize=4096)
+@cached("long")
+async def _geocode(city):
     params = {"q": city, "limit": 1, "appid": API_KEY}
-    r = requests.get(url, params=params)
-    data = r.json()
+    r = await app.state.http.get(GEOCODE_URL, params=params)
+    data = upstream_json(r)
     if not data:
         raise HTTPException(404, "City not found")
     return data[0]["lat"], data[0]["lon"], data[0]["name"], data[0].get("country", "")
 
 
-def one_call(lat, lon, units="metric", exclude=""):
-    """Safe OneCall wrapper."""
-    url = "https://api.openweathermap.org/data/2.5/onecall"
+async def one_call(lat, lon, units="metric", exclude=""):
+    """OneCall wrapper; returns None when the upstream call fails."""
     params = {
         "lat": lat,
         "lon": lon,
@@ -49,27 +246,60 @@ def one_call(lat, lon, units="metric", exclude=""):
         "units": units,
         "exclude": exclude,
     }
-    r = requests.get(url, params=params)
+    r = await app.state.http.get(ONECALL_URL, params=params)
+    try:
+        if r.status_code == 200:
+            return orjson.loads(r.content)
+    except orjson.JSONDecodeError:
+        pass
+    mark_degraded()
+    return None
+
+
+# /forecast and /hourly share the same upstream payload; concurrent callers
+# for the same location await a single request
+@alru_cache(maxsize=1024, ttl=60)
+async def _fetch_forecast(lat, lon, units):
+    params = {"lat": lat, "lon": lon, "appid": API_KEY, "units": units}
+
+    r = await app.state.http.get(FORECAST_URL, params=params)
     if r.status_code != 200:
-        return {}
-    return r.json()
+        raise HTTPException(500, "Forecast unavailable")
+
+    return upstream_json(r)
 
 
 # ============================================================
 # Current Weather
 # ============================================================
 
-@app.get("/weather")
-def get_weather(city: str, units: str = "metric"):
-    units = validate_units(units)
-    url = "https://api.openweathermap.org/data/2.5/weather"
-    params = {"q": city, "appid": API_KEY, "units": units}
-
-    r = requests.get(url, params=params)
-    if r.status_code != 200:
+class WeatherOut(BaseModel):
+    city: str
+    temperature: float
+    feels_like: float
+    temp_min: float
+    temp_max: float
+    humidity: int
+    wind_speed: float
+    sunrise: int
+    sunset: int
+    condition: str
+    icon: str
+    rain_1h: Optional[float] = None
+    rain_3h: Optional[float] = None
+    snow_1h: Optional[float] = None
+    snow_3h: Optional[float] = None
+
+
+async def _fetch_weather_raw(query, units):
+    """Fetch current weather for a `q` or `lat`/`lon` query."""
+    params = {**query, "appid": API_KEY, "units": units}
+
+    r = await app.state.http.get(WEATHER_URL, params=params)
+    if r.status_code != 200 and r.status_code < 500:
         raise HTTPException(404, "City not found")
 
-    data = r.json()
+    data = upstream_json(r)
 
     return {
         "city": data["name"],
@@ -90,64 +320,85 @@ def get_weather(city: str, units: str = "metric"):
     }
 
 
+async def _weather_by_coords(lat, lon, units):
+    return await _fetch_weather_raw({"lat": lat, "lon": lon}, units)
+
+
+@app.get("/weather", response_model=WeatherOut)
+@cached("normal")
+async def get_weather(city: str, units: str = "metric"):
+    units = validate_units(units)
+    return await _fetch_weather_raw({"q": city}, units)
+
+
 # ============================================================
 # Forecast (Daily)
 # ============================================================
 
-@app.get("/forecast")
-def get_forecast(city: str, units: str = "metric"):
-    units = validate_units(units)
-    lat, lon, name, _ = geocode_city(city)
+class DailyOut(BaseModel):
+    date: str
+    min_temp: float
+    max_temp: float
+    humidity: int
+    condition: str
+    icon: str
+    precip_mm: float
 
-    url = "https://api.openweathermap.org/data/2.5/forecast"
-    params = {"lat": lat, "lon": lon, "appid": API_KEY, "units": units}
 
-    r = requests.get(url, params=params)
-    if r.status_code != 200:
-        raise HTTPException(500, "Forecast unavailable")
+class ForecastOut(BaseModel):
+    city: str
+    daily: List[DailyOut]
+
+
+@app.get("/forecast", response_model=ForecastOut)
+@cached("long")
+async def get_forecast(city: str, units: str = "metric"):
+    units = validate_units(units)
+    lat, lon, name, _ = await geocode_city(city)
 
-    data = r.json()
+    data = await _fetch_forecast(lat, lon, units)
 
+    # date -> [min_temp, max_temp, humidity, condition, icon, precip_mm]
     daily = {}
 
     for entry in data["list"]:
-        date = entry["dt_txt"].split(" ")[0]
-        temp = entry["main"]["temp"]
-        humidity = entry["main"]["humidity"]
-        condition = entry["weather"][0]["description"]
-        icon = entry["weather"][0]["icon"]
+        date = entry["dt_txt"][:10]
+        main = entry["main"]
+        temp = main["temp"]
 
         rain = entry.get("rain", {}).get("3h", 0)
         snow = entry.get("snow", {}).get("3h", 0)
-        precip = rain + snow
-
-        if date not in daily:
-            daily[date] = {
-                "min_temp": temp,
-                "max_temp": temp,
-                "humidity": humidity,
-                "condition": condition,
-                "icon": icon,
-                "precip_mm": precip,
-            }
-        else:
-            daily[date]["min_temp"] = min(daily[date]["min_temp"], temp)
-            daily[date]["max_temp"] = max(daily[date]["max_temp"], temp)
-            daily[date]["precip_mm"] += precip
 
-    result = []
-    for d in list(daily.keys())[:5]:
-        result.append(
-            {
-                "date": d,
-                "min_temp": daily[d]["min_temp"],
-                "max_temp": daily[d]["max_temp"],
-                "humidity": daily[d]["humidity"],
-                "condition": daily[d]["condition"],
-                "icon": daily[d]["icon"],
-                "precip_mm": round(daily[d]["precip_mm"], 2),
-            }
-        )
+        slot = daily.get(date)
+        if slot is None:
+            weather = entry["weather"][0]
+            daily[date] = [
+                temp,
+                temp,
+                main["humidity"],
+                weather["description"],
+                weather["icon"],
+                rain + snow,
+            ]
+        else:
+            if temp < slot[0]:
+                slot[0] = temp
+            if temp > slot[1]:
+                slot[1] = temp
+            slot[5] += rain + snow
+
+    result = [
+        {
+            "date": d,
+            "min_temp": slot[0],
+            "max_temp": slot[1],
+            "humidity": slot[2],
+            "condition": slot[3],
+            "icon": slot[4],
+            "precip_mm": round(slot[5], 2),
+        }
+        for d, slot in islice(daily.items(), 5)
+    ]
 
     return {"city": name, "daily": result}
 
@@ -156,21 +407,34 @@ def get_forecast(city: str, units: str = "metric"):
 # Hourly Forecast
 # ============================================================
 
-@app.get("/hourly")
-def get_hourly(city: str, units: str = "metric", hours: int = 12):
-    units = validate_units(units)
-    lat, lon, name, _ = geocode_city(city)
+class HourlyOut(BaseModel):
+    time: str
+    temperature: float
+    feels_like: float
+    humidity: int
+    condition: str
+    icon: str
 
-    url = "https://api.openweathermap.org/data/2.5/forecast"
-    params = {"lat": lat, "lon": lon, "appid": API_KEY, "units": units}
 
-    r = requests.get(url, params=params)
-    data = r.json()
+class TimelineOut(BaseModel):
+    city: str
+    timeline: List[HourlyOut]
 
+
+@app.get("/hourly", response_model=TimelineOut)
+@cached("long")
+async def get_hourly(city: str, units: str = "metric", hours: int = 12):
+    units = validate_units(units)
+    lat, lon, name, _ = await geocode_city(city)
+
+    data = await _fetch_forecast(lat, lon, units)
+
+    # The 3-hourly forecast only covers 5 days
+    hours = max(0, min(hours, 120))
     needed = math.ceil(hours / 3)
     timeline = []
 
-    for entry in data["list"][:needed]:
+    for entry in islice(data["list"], needed):
         timeline.append(
             {
                 "time": entry["dt_txt"],
@@ -190,8 +454,9 @@ def get_hourly(city: str, units: str = "metric", hours: int = 12):
 # ============================================================
 
 @app.get("/coords")
-def coords(city: str):
-    lat, lon, name, country = geocode_city(city)
+@cached("long")
+async def coords(city: str):
+    lat, lon, name, country = await geocode_city(city)
     return {"city": name, "country": country, "lat": lat, "lon": lon}
 
 
@@ -199,54 +464,46 @@ def coords(city: str):
 # UV Index (safe fallback)
 # ============================================================
 
-@app.get("/uv")
-def get_uv(city: str, units: str = "metric"):
-    units = validate_units(units)
-    lat, lon, name, _ = geocode_city(city)
+async def _uv_by_coords(lat, lon, units):
+    data = await one_call(lat, lon, units, exclude="hourly,daily,minutely")
 
-    data = one_call(lat, lon, units, exclude="hourly,daily,minutely")
+    uvi = data["current"]["uvi"] if data and "current" in data else 0  # SAFE FALLBACK
 
-    uvi = data.get("current", {}).get("uvi", 0)  # SAFE FALLBACK
+    category = UV_CATEGORIES[bisect_right(UV_BOUNDS, uvi)]
 
-    if uvi < 3:
-        category = "Low"
-    elif uvi < 6:
-        category = "Moderate"
-    elif uvi < 8:
-        category = "High"
-    elif uvi < 11:
-        category = "Very High"
-    else:
-        category = "Extreme"
+    return {"uv_index": uvi, "uv_category": category}
 
-    return {"city": name, "uv_index": uvi, "uv_category": category}
+
+@app.get("/uv")
+@cached("normal")
+async def get_uv(city: str, units: str = "metric"):
+    units = validate_units(units)
+    lat, lon, name, _ = await geocode_city(city)
+    return {"city": name, **await _uv_by_coords(lat, lon, units)}
 
 
 # ============================================================
 # AQI
 # ============================================================
 
-@app.get("/aqi")
-def get_aqi(city: str):
-    lat, lon, name, _ = geocode_city(city)
-
-    url = "http://api.openweathermap.org/data/2.5/air_pollution"
+async def _aqi_by_coords(lat, lon):
     params = {"lat": lat, "lon": lon, "appid": API_KEY}
 
-    r = requests.get(url, params=params)
-    data = r.json()
+    r = await app.state.http.get(AIR_POLLUTION_URL, params=params)
+    data = upstream_json(r)
 
     aqi = data["list"][0]["main"]["aqi"]
 
-    category = {
-        1: "Good",
-        2: "Fair",
-        3: "Moderate",
-        4: "Poor",
-        5: "Very Poor",
-    }.get(aqi, "Unknown")
+    category = AQI_CATEGORIES.get(aqi, "Unknown")
+
+    return {"aqi": aqi, "category": category}
 
-    return {"city": name, "aqi": aqi, "category": category}
+
+@app.get("/aqi")
+@cached("long")
+async def get_aqi(city: str):
+    lat, lon, name, _ = await geocode_city(city)
+    return {"city": name, **await _aqi_by_coords(lat, lon)}
 
 
 # ============================================================
@@ -254,20 +511,19 @@ def get_aqi(city: str):
 # ============================================================
 
 @app.get("/alerts")
-def get_alerts(city: str, units: str = "metric"):
+@cached("normal")
+async def get_alerts(city: str, units: str = "metric"):
     units = validate_units(units)
-    lat, lon, name, _ = geocode_city(city)
-
-    data = one_call(lat, lon, units, exclude="current,minutely,hourly,daily")
+    lat, lon, name, _ = await geocode_city(city)
 
-    alerts = data.get("alerts", [])
+    data = await one_call(lat, lon, units, exclude="current,minutely,hourly,daily")
 
     # SAFE FALLBACK — no crash
-    if not alerts:
+    if not data or not data.get("alerts"):
         return {"city": name, "alerts": []}
 
     result = []
-    for a in alerts:
+    for a in data["alerts"]:
         result.append(
             {
                 "event": a.get("event", "No title"),
@@ -284,38 +540,33 @@ def get_alerts(city: str, units: str = "metric"):
 # ============================================================
 
 @app.get("/outfit")
-def outfit(city: str, units: str = "metric"):
+@cached("short")
+async def outfit(city: str, units: str = "metric"):
     units = validate_units(units)
-    weather = get_weather(city, units)
-    uv = get_uv(city, units)
+
+    async def uv_for_city():
+        # Geocode is an in-process cache hit on warm requests
+        lat, lon, _, _ = await geocode_city(city)
+        return await _uv_by_coords(lat, lon, units)
+
+    weather, uv = await asyncio.gather(_fetch_weather_raw({"q": city}, units), uv_for_city())
 
     temp = weather["temperature"]
     condition = weather["condition"]
     wind = weather["wind_speed"] or 0
 
-    rain = (weather.get("rain_1h") or 0) + (weather.get("rain_3h") or 0)
-    snow = (weather.get("snow_1h") or 0) + (weather.get("snow_3h") or 0)
+    r1 = weather["rain_1h"] or 0
+    r3 = weather["rain_3h"] or 0
+    s1 = weather["snow_1h"] or 0
+    s3 = weather["snow_3h"] or 0
+    rain = r1 + r3
+    snow = s1 + s3
     precip = rain + snow
 
-    temp_c = temp if units == "metric" else (temp - 32) * 5 / 9
-
-    clothing = []
-    accessories = []
-    notes = []
-
     # Temperature logic
-    if temp_c <= 0:
-        clothing.append("Heavy winter coat")
-        accessories.append("Gloves, scarf, warm hat")
-        notes.append("Very cold weather.")
-    elif temp_c <= 10:
-        clothing.append("Coat or thick jacket")
-        notes.append("Cool temperatures.")
-    elif temp_c <= 20:
-        clothing.append("Light jacket or sweater")
-    else:
-        clothing.append("Light clothing")
-        notes.append("Warm temperatures.")
+    clothing, accessories, notes = (
+        list(items) for items in OUTFIT_TIERS[bisect_left(OUTFIT_TEMP_BOUNDS[units], temp)]
+    )
 
     # Precipitation
     if rain > 0:
@@ -330,10 +581,13 @@ def outfit(city: str, units: str = "metric"):
         accessories.append("Sunscreen")
         notes.append(f"UV levels are {uv['uv_category'].lower()}.")
 
-    summary = f"In {city}, it's {round(temp,1)}°{'C' if units=='metric' else 'F'} with {condition}."
+    unit_symbol = "C" if units == "metric" else "F"
+    # Cache keys are case-insensitive, so echo OpenWeather's name, not the raw input
+    name = weather["city"]
+    summary = f"In {name}, it's {temp:.1f}°{unit_symbol} with {condition}."
 
     return {
-        "city": city,
+        "city": name,
         "temperature": temp,
         "condition": condition,
         "precip_mm": round(precip, 2),
@@ -349,31 +603,59 @@ def outfit(city: str, units: str = "metric"):
 # MULTI-CITY COMPARISON
 # ============================================================
 
-@app.get("/compare")
-def compare(cities: str, units: str = "metric"):
+class CityCompareOut(BaseModel):
+    city: str
+    temperature: float
+    condition: str
+    humidity: int
+    wind_speed: float
+    aqi: int
+    aqi_category: str
+
+
+class CompareOut(BaseModel):
+    cities: List[CityCompareOut]
+
+
+async def _one_city(name, units):
+    async with COMPARE_LIMIT:
+        # One geocode per city, reused for both weather and AQI
+        lat, lon, city, _ = await geocode_city(name)
+        w, aq = await asyncio.gather(
+            _weather_by_coords(lat, lon, units), _aqi_by_coords(lat, lon)
+        )
+
+    # Coordinate lookups report the nearest station, so keep the geocoded name
+    return {
+        "city": city,
+        "temperature": w["temperature"],
+        "condition": w["condition"],
+        "humidity": w["humidity"],
+        "wind_speed": w["wind_speed"],
+        "aqi": aq["aqi"],
+        "aqi_category": aq["category"],
+    }
+
+
+@app.get("/compare", response_model=CompareOut)
+@cached("short")
+async def compare(cities: str, units: str = "metric"):
     units = validate_units(units)
     names = [c.strip() for c in cities.split(",") if c.strip()]
 
-    result = []
+    raw = await asyncio.gather(*(_one_city(n, units) for n in names), return_exceptions=True)
 
-    for name in names:
-        try:
-            w = get_weather(name, units)
-            aq = get_aqi(name)
-
-            result.append(
-                {
-                    "city": w["city"],
-                    "temperature": w["temperature"],
-                    "condition": w["condition"],
-                    "humidity": w["humidity"],
-                    "wind_speed": w["wind_speed"],
-                    "aqi": aq["aqi"],
-                    "aqi_category": aq["category"],
-                }
-            )
-        except:
-            continue
+    # A city that fails upstream (unknown name, OpenWeather error) is dropped;
+    # anything else is a bug and must surface
+    result = []
+    for x in raw:
+        if isinstance(x, (HTTPException, httpx.HTTPError)):
+            if upstream_failed(x):
+                mark_degraded()
+        elif isinstance(x, BaseException):
+            raise x
+        else:
+            result.append(x)
 
     return {"cities": result}
 
@@ -393,12 +675,12 @@ def travel_checklist(city: str, units: str = "metric"):
 # ============================================================
 
 @app.get("/reverse_geocode")
-def reverse_geocode(lat: float, lon: float):
-    geo_url = "http://api.openweathermap.org/geo/1.0/reverse"
+@cached("long")
+async def reverse_geocode(lat: float, lon: float):
     params = {"lat": lat, "lon": lon, "limit": 1, "appid": API_KEY}
 
-    resp = requests.get(geo_url, params=params)
-    data = resp.json()
+    resp = await app.state.http.get(REVERSE_GEOCODE_URL, params=params)
+    data = upstream_json(resp)
 
     # SAFE FALLBACKS to avoid undefined
     if resp.status_code != 200 or not data:
@@ -412,3 +694,17 @@ def reverse_geocode(lat: float, lon: float):
     )
 
     return {"city": city}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        # I/O-bound workload, so oversubscribe the cores
+        workers=int(os.getenv("WEB_CONCURRENCY", 2 * (os.cpu_count() or 1))),
+    )
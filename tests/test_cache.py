@@ -0,0 +1,134 @@
+import asyncio
+
+import fakeredis
+import httpx
+import pytest
+from fastapi import HTTPException
+
+import main
+
+GEO = [{"lat": 51.5, "lon": -0.12, "name": "London", "country": "GB"}]
+AIR = {"list": [{"main": {"aqi": 2}}]}
+ONECALL = {"current": {"uvi": 7.2}}
+WEATHER = {
+    "name": "London",
+    "main": {"temp": 10.0, "feels_like": 9.0, "temp_min": 8.0, "temp_max": 11.0, "humidity": 80},
+    "wind": {"speed": 3.0},
+    "sys": {"sunrise": 1, "sunset": 2},
+    "weather": [{"description": "light rain", "icon": "10d"}],
+}
+
+
+@pytest.fixture(scope="module")
+def run():
+    """Run coroutines on one shared loop; alru_cache binds to the first loop it sees."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture
+def upstream(monkeypatch, run):
+    """Fake OpenWeather; set `down` to make data endpoints return an HTML 502."""
+    state = {"down": False, "calls": []}
+
+    def handler(request):
+        state["calls"].append(request.url.path)
+        if request.url.path == main.GEOCODE_URL:
+            return httpx.Response(200, json=GEO)
+        if state["down"]:
+            return httpx.Response(502, text="<html>Bad Gateway</html>")
+        if request.url.path == main.AIR_POLLUTION_URL:
+            return httpx.Response(200, json=AIR)
+        if request.url.path == main.ONECALL_URL:
+            return httpx.Response(200, json=ONECALL)
+        if request.url.path == main.WEATHER_URL:
+            temp = 50.0 if request.url.params["units"] == "imperial" else 10.0
+            return httpx.Response(200, json={**WEATHER, "main": {**WEATHER["main"], "temp": temp}})
+        return httpx.Response(404, json={"cod": "404"})
+
+    main._geocode.cache_clear()
+    main._fetch_forecast.cache_clear()
+    client = httpx.AsyncClient(
+        base_url=main.OPENWEATHER_BASE_URL, transport=httpx.MockTransport(handler)
+    )
+    main.app.state.http = client
+    main.app.state.redis = fakeredis.FakeAsyncRedis()
+
+    now = [1_000_000.0]
+    monkeypatch.setattr(main, "_now", lambda: now[0])
+    state["now"] = now
+    yield state
+
+    main.app.state.redis = None
+    main._geocode.cache_clear()
+    main._fetch_forecast.cache_clear()
+    run(client.aclose())
+
+
+def test_fresh_entry_served_from_cache(upstream, run):
+    async def fetch():
+        return await main.get_aqi("London"), await main.get_aqi("London")
+
+    first, second = run(fetch())
+
+    assert first == second == {"city": "London", "aqi": 2, "category": "Fair"}
+    assert upstream["calls"].count(main.AIR_POLLUTION_URL) == 1
+
+
+def test_stale_entry_served_when_upstream_fails(upstream, run):
+    async def fetch():
+        good = await main.get_aqi("London")
+        upstream["now"][0] += main.CACHE_TTLS["long"] + 1
+        upstream["down"] = True
+        return good, await main.get_aqi("London")
+
+    good, fallback = run(fetch())
+
+    assert fallback == good
+    assert upstream["calls"].count(main.AIR_POLLUTION_URL) == 2
+
+
+def test_degraded_result_does_not_overwrite_good_entry(upstream, run):
+    async def fetch():
+        good = await main.get_uv("London")
+        upstream["now"][0] += main.CACHE_TTLS["normal"] + 1
+        upstream["down"] = True
+        # Had the placeholder UV been stored as fresh, the second call
+        # would return it without asking the upstream again
+        return good, await main.get_uv("London"), await main.get_uv("London")
+
+    good, first, second = run(fetch())
+
+    assert good["uv_category"] == "High"
+    assert first == second == good
+    assert upstream["calls"].count(main.ONECALL_URL) == 3
+
+
+def test_without_redis_upstream_errors_surface_as_502(upstream, run):
+    main.app.state.redis = None
+
+    async def fetch():
+        await main.get_aqi("London")
+        upstream["down"] = True
+        await main.get_aqi("London")
+
+    with pytest.raises(HTTPException) as exc:
+        run(fetch())
+
+    assert exc.value.status_code == 502
+    assert upstream["calls"].count(main.AIR_POLLUTION_URL) == 2
+
+
+def test_invalid_units_do_not_share_a_key_with_valid_ones(upstream, run):
+    async def fetch():
+        # IMPERIAL is not a valid unit system, so the handler serves metric
+        return (
+            await main.get_weather("London", units="IMPERIAL"),
+            await main.get_weather("London", units="imperial"),
+        )
+
+    fallback, imperial = run(fetch())
+
+    assert fallback["temperature"] == 10.0
+    assert imperial["temperature"] == 50.0